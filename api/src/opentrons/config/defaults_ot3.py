@@ -1,6 +1,6 @@
-from typing import Any, Dict, cast, List, Iterable, Tuple, Optional
+from typing import Any, Dict, cast, List, Optional
 from typing_extensions import Final
-from dataclasses import asdict
+from dataclasses import fields, is_dataclass
 
 from opentrons.hardware_control.types import OT3AxisKind, InstrumentProbeType
 from .types import (
@@ -452,21 +452,24 @@ def build_with_defaults(robot_settings: Dict[str, Any]) -> OT3Config:
     )
 
 
-def serialize(config: OT3Config) -> Dict[str, Any]:
-    def _build_dict(pairs: Iterable[Tuple[Any, Any]]) -> Dict[str, Any]:
-        def _normalize_key(key: Any) -> Any:
-            if isinstance(key, OT3AxisKind) or isinstance(key, InstrumentProbeType):
-                return key.name
-            return key
-
-        def _normalize_value(value: Any) -> Any:
-            if isinstance(value, dict):
-                return {
-                    _normalize_key(k): _normalize_value(v) for k, v in value.items()
-                }
-            else:
-                return value
+def _serialize_key(key: Any) -> Any:
+    if isinstance(key, (OT3AxisKind, InstrumentProbeType)):
+        return key.name
+    return key
+
 
-        return dict((_normalize_key(key), _normalize_value(val)) for key, val in pairs)
+def _serialize_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {_serialize_key(k): _serialize_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(_serialize_value(v) for v in value)
+    if is_dataclass(value):
+        return {
+            field.name: _serialize_value(getattr(value, field.name))
+            for field in fields(value)
+        }
+    return value
 
-    return asdict(config, dict_factory=_build_dict)
+
+def serialize(config: OT3Config) -> Dict[str, Any]:
+    return cast(Dict[str, Any], _serialize_value(config))
@@ -1,6 +1,6 @@
 from enum import Enum
-from dataclasses import dataclass, asdict, fields
-from typing import Dict, Tuple, TypeVar, Generic, List, cast, Optional
+from dataclasses import dataclass, fields
+from typing import ClassVar, Dict, Tuple, TypeVar, Generic, List, Optional
 from typing_extensions import TypedDict, Literal
 from opentrons.hardware_control.types import OT3AxisKind, InstrumentProbeType
 
@@ -22,13 +22,18 @@ class GantryLoad(Enum):
     LOW_THROUGHPUT = "low_throughput"
 
 
-@dataclass
+@dataclass(slots=True)
 class ByGantryLoad(Generic[Vt]):
     high_throughput: Vt
     low_throughput: Vt
 
     def __getitem__(self, key: GantryLoad) -> Vt:
-        return cast(Vt, asdict(self)[key.value])
+        # identity checks on the two members avoid hashing the key at all
+        if key is GantryLoad.HIGH_THROUGHPUT:
+            return self.high_throughput
+        elif key is GantryLoad.LOW_THROUGHPUT:
+            return self.low_throughput
+        raise KeyError(key)
 
 
 PerPipetteAxisSettings = ByGantryLoad[Dict[OT3AxisKind, float]]
@@ -52,7 +57,7 @@ class CurrentDict(CurrentDictDefault, CurrentDictModelEntries):
 Offset = Tuple[float, float, float]
 
 
-@dataclass
+@dataclass(slots=True)
 class RobotConfig:
     model: Literal["OT-2 Standard"]
     name: str
@@ -73,34 +78,55 @@ class RobotConfig:
 OT3Transform = List[List[float]]
 
 
-@dataclass(frozen=True)
-class OT3MotionSettings:
+class _SettingsByGantryLoad:
+    """Shared per-gantry-load view for frozen settings dataclasses.
+
+    The instances are immutable, so the view for each gantry load is only
+    built once and then reused. The cache is created on first use rather than
+    in ``__post_init__`` because copied and unpickled instances are restored
+    from their fields alone.
+    """
+
+    __slots__ = ("_by_gantry_load_cache",)
+
+    _FIELD_NAMES: ClassVar[Tuple[str, ...]] = ()
+    _by_gantry_load_cache: Dict[GantryLoad, Dict[str, Dict[OT3AxisKind, float]]]
+
+    def by_gantry_load(
+        self, gantry_load: GantryLoad
+    ) -> Dict[str, Dict[OT3AxisKind, float]]:
+        try:
+            cache = self._by_gantry_load_cache
+        except AttributeError:
+            cache = {}
+            object.__setattr__(self, "_by_gantry_load_cache", cache)
+        cached = cache.get(gantry_load)
+        if cached is None:
+            cached = {
+                name: getattr(self, name)[gantry_load] for name in self._FIELD_NAMES
+            }
+            cache[gantry_load] = cached
+        return cached
+
+
+@dataclass(frozen=True, slots=True)
+class OT3MotionSettings(_SettingsByGantryLoad):
     default_max_speed: PerPipetteAxisSettings
     acceleration: PerPipetteAxisSettings
     max_speed_discontinuity: PerPipetteAxisSettings
     direction_change_speed_discontinuity: PerPipetteAxisSettings
 
-    def by_gantry_load(
-        self, gantry_load: GantryLoad
-    ) -> Dict[str, Dict[OT3AxisKind, float]]:
-        return dict(
-            (field.name, getattr(self, field.name)[gantry_load])
-            for field in fields(self)
-        )
 
+OT3MotionSettings._FIELD_NAMES = tuple(f.name for f in fields(OT3MotionSettings))
 
-@dataclass(frozen=True)
-class OT3CurrentSettings:
+
+@dataclass(frozen=True, slots=True)
+class OT3CurrentSettings(_SettingsByGantryLoad):
     hold_current: PerPipetteAxisSettings
     run_current: PerPipetteAxisSettings
 
-    def by_gantry_load(
-        self, gantry_load: GantryLoad
-    ) -> Dict[str, Dict[OT3AxisKind, float]]:
-        return dict(
-            (field.name, getattr(self, field.name)[gantry_load])
-            for field in fields(self)
-        )
+
+OT3CurrentSettings._FIELD_NAMES = tuple(f.name for f in fields(OT3CurrentSettings))
 
 
 class OutputOptions(int, Enum):
@@ -129,7 +155,7 @@ class ZSenseSettings:
     pass_settings: CapacitivePassSettings
 
 
-@dataclass
+@dataclass(slots=True)
 class LiquidProbeSettings:
     starting_mount_height: float
     max_z_distance: float
@@ -141,7 +167,7 @@ class LiquidProbeSettings:
     data_files: Optional[Dict[InstrumentProbeType, str]]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EdgeSenseSettings:
     overrun_tolerance_mm: float
     early_sense_tolerance_mm: float
@@ -175,7 +201,7 @@ class OT3CalibrationSettings:
     probe_length: float
 
 
-@dataclass
+@dataclass(slots=True)
 class OT3Config:
     model: Literal["OT-3 Standard"]
     name: str
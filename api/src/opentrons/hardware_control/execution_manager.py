@@ -1,7 +1,8 @@
 import asyncio
 import functools
+from weakref import WeakSet
 from typing import (
-    Set,
+    Optional,
     TypeVar,
     Type,
     cast,
@@ -27,53 +28,67 @@ class ExecutionManager:
 
     def __init__(self) -> None:
         self._state: ExecutionState = ExecutionState.RUNNING
-        self._condition = asyncio.Condition()
+        # most managers never pause or cancel, so only build this when needed
+        self._condition: Optional[asyncio.Condition] = None
         # this Task would technically be parametrized with every different thing
         # that you could possible call register_cancellable_task on unfortunately
         # so it's not gonna get typechecked
-        self._cancellable_tasks: Set["asyncio.Task[Any]"] = set()
+        # held weakly so that finished tasks drop out without a done callback
+        self._cancellable_tasks: "WeakSet[asyncio.Task[Any]]" = WeakSet()
+
+    def _get_condition(self) -> asyncio.Condition:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
 
     async def pause(self) -> None:
-        async with self._condition:
+        condition = self._get_condition()
+        async with condition:
             if self._state is ExecutionState.CANCELLED:
                 raise ExecutionCancelledError
             else:
                 self._state = ExecutionState.PAUSED
 
     async def resume(self) -> None:
-        async with self._condition:
+        condition = self._get_condition()
+        async with condition:
             if self._state is ExecutionState.CANCELLED:
                 pass
             else:
                 self._state = ExecutionState.RUNNING
-                self._condition.notify_all()
+                condition.notify_all()
 
     async def cancel(self) -> None:
-        async with self._condition:
+        condition = self._get_condition()
+        async with condition:
             self._state = ExecutionState.CANCELLED
-            self._condition.notify_all()
+            condition.notify_all()
             running_task = asyncio.current_task()
             for t in self._cancellable_tasks:
                 if t is not running_task:
                     t.cancel()
 
     async def reset(self) -> None:
-        async with self._condition:
+        condition = self._get_condition()
+        async with condition:
             self._state = ExecutionState.RUNNING
-            self._condition.notify_all()
+            condition.notify_all()
 
-    async def get_state(self) -> ExecutionState:
-        async with self._condition:
-            return self._state
+    def get_state(self) -> ExecutionState:
+        # _state is only ever replaced while holding the condition, so a
+        # plain read always sees a complete value
+        return self._state
 
     def register_cancellable_task(self, task: "asyncio.Task[TaskContents]") -> None:
         self._cancellable_tasks.add(task)
-        task.add_done_callback(lambda t: self._cancellable_tasks.discard(t))
 
     async def wait_for_is_running(self) -> None:
-        async with self._condition:
+        if self._state is ExecutionState.RUNNING:
+            return
+        condition = self._get_condition()
+        async with condition:
             if self._state == ExecutionState.PAUSED:
-                await self._condition.wait()
+                await condition.wait()
                 # type-ignore needed because this is a reentrant function and narrowing cannot
                 # apply
                 if self._state == ExecutionState.CANCELLED:  # type: ignore[comparison-overlap]
@@ -131,7 +146,10 @@ class ExecutionManagerProvider:
             **kwargs: DecoratedMethodParams.kwargs,
         ) -> DecoratedReturn:
             if not inst._em_simulate:
-                await inst.execution_manager.wait_for_is_running()
+                execution_manager = inst.execution_manager
+                # skip creating a coroutine at all in the usual, running case
+                if execution_manager.get_state() is not ExecutionState.RUNNING:
+                    await execution_manager.wait_for_is_running()
             if inst.taskify_movement_execution:
                 # Running these functions inside cancellable tasks makes it easier and
                 # faster to cancel protocol runs. In the higher, runner & engine layers,
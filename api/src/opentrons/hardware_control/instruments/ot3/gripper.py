@@ -85,6 +85,9 @@ class Gripper(AbstractInstrument[GripperDefinition]):
             f"loaded: {self._model}, gripper offset: {self._calibration_offset}"
         )
         self._jaw_max_offset = jaw_max_offset
+        #: duty cycles for the profile's default forces, which are used for
+        #: nearly every grip, ungrip and home; built on first use
+        self._default_duty_cycles: Optional[Dict[float, float]] = None
 
     @property
     def grip_force_profile(self) -> GripForceProfile:
@@ -285,8 +288,27 @@ class Gripper(AbstractInstrument[GripperDefinition]):
         else:
             raise InvalidCriticalPoint(cp.name, "gripper")
 
+    def _get_default_duty_cycles(self) -> Dict[float, float]:
+        if self._default_duty_cycles is None:
+            profile = self.grip_force_profile
+            self._default_duty_cycles = {
+                force: gripper_config.duty_cycle_by_force(force, profile)
+                for force in (
+                    profile.default_grip_force,
+                    profile.default_idle_force,
+                    profile.default_home_force,
+                )
+                if profile.min <= force <= profile.max
+            }
+        return self._default_duty_cycles
+
     def duty_cycle_by_force(self, newton: float) -> float:
-        return gripper_config.duty_cycle_by_force(newton, self.grip_force_profile)
+        duty_cycle = self._get_default_duty_cycles().get(newton)
+        if duty_cycle is None:
+            duty_cycle = gripper_config.duty_cycle_by_force(
+                newton, self.grip_force_profile
+            )
+        return duty_cycle
 
     def __str__(self) -> str:
         return f"{self._config.display_name}"
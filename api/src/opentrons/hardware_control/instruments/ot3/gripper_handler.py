@@ -107,16 +107,14 @@ class GripperHandler:
     def add_probe(self, probe: GripperProbe) -> None:
         """This is used for finding the critical point during calibration."""
         gripper = self.get_gripper()
-        current_probe = self.get_attached_probe()
-        if not current_probe:
+        if not gripper.attached_probe:
             gripper.add_probe(probe)
         else:
             self._log.warning("add probe called with a probe already attached.")
 
     def remove_probe(self) -> None:
         gripper = self.get_gripper()
-        current_probe = self.get_attached_probe()
-        if current_probe:
+        if gripper.attached_probe:
             gripper.remove_probe()
         else:
             self._log.warning("remove probe called without a probe attached")
@@ -128,25 +126,25 @@ class GripperHandler:
 
     def check_ready_for_jaw_move(self, command: str) -> None:
         """Raise an exception if it is not currently valid to move the jaw."""
-        gripper = self.get_gripper()
-        if gripper.state == GripperJawState.UNHOMED:
+        state = self.get_gripper().state
+        if state == GripperJawState.UNHOMED:
             raise CommandPreconditionViolated(
                 message=f"Cannot {command} gripper jaw before homing",
                 detail={
                     "command": command,
-                    "jaw_state": str(gripper.state),
+                    "jaw_state": str(state),
                 },
             )
 
     def is_ready_for_idle(self) -> bool:
         """Gripper can idle when the jaw is not currently gripping."""
-        gripper = self.get_gripper()
-        if gripper.state == GripperJawState.UNHOMED:
+        state = self.get_gripper().state
+        if state == GripperJawState.UNHOMED:
             self._log.warning(
                 "Gripper jaw is not homed and cannot move to idle position."
             )
             return False
-        return gripper.state != GripperJawState.GRIPPING
+        return state != GripperJawState.GRIPPING
 
     def is_ready_for_jaw_home(self) -> bool:
         """Raise an exception if it is not currently valid to home the jaw."""
@@ -169,5 +167,5 @@ class GripperHandler:
         gripper.current_jaw_displacement = mm
 
     def is_valid_jaw_width(self, mm: float) -> bool:
-        conf = self.get_gripper().geometry
-        return conf.jaw_width["min"] <= mm <= conf.jaw_width["max"]
+        jaw_width = self.get_gripper().geometry.jaw_width
+        return jaw_width["min"] <= mm <= jaw_width["max"]
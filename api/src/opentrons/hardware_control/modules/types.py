@@ -56,36 +56,16 @@ class ModuleType(str, Enum):
 
     @classmethod
     def from_model(cls, model: ModuleModel) -> ModuleType:
-        if isinstance(model, MagneticModuleModel):
-            return cls.MAGNETIC
-        if isinstance(model, TemperatureModuleModel):
-            return cls.TEMPERATURE
-        if isinstance(model, ThermocyclerModuleModel):
-            return cls.THERMOCYCLER
-        if isinstance(model, HeaterShakerModuleModel):
-            return cls.HEATER_SHAKER
-        if isinstance(model, MagneticBlockModel):
-            return cls.MAGNETIC_BLOCK
-        if isinstance(model, AbsorbanceReaderModel):
-            return cls.ABSORBANCE_READER
+        return _MODULE_TYPE_BY_MODEL_CLASS[type(model)]
 
     @classmethod
     def to_module_fixture_id(cls, module_type: ModuleType) -> str:
-        if module_type == ModuleType.THERMOCYCLER:
-            # Thermocyclers are "loaded" in B1 only
-            return "thermocyclerModuleV2Front"
-        if module_type == ModuleType.TEMPERATURE:
-            return "temperatureModuleV2"
-        if module_type == ModuleType.HEATER_SHAKER:
-            return "heaterShakerModuleV1"
-        if module_type == ModuleType.MAGNETIC_BLOCK:
-            return "magneticBlockV1"
-        if module_type == ModuleType.ABSORBANCE_READER:
-            return "absorbanceReaderV1"
-        else:
+        fixture_id = _MODULE_FIXTURE_ID_BY_TYPE.get(module_type)
+        if fixture_id is None:
             raise ValueError(
                 f"Module Type {module_type} does not have a related fixture ID."
             )
+        return fixture_id
 
 
 class MagneticModuleModel(str, Enum):
@@ -115,20 +95,43 @@ class AbsorbanceReaderModel(str, Enum):
     ABSORBANCE_READER_V1: str = "absorbanceReaderV1"
 
 
-def module_model_from_string(model_string: str) -> ModuleModel:
-    for model_enum in {
-        MagneticModuleModel,
+_MODULE_TYPE_BY_MODEL_CLASS: Dict[type, ModuleType] = {
+    MagneticModuleModel: ModuleType.MAGNETIC,
+    TemperatureModuleModel: ModuleType.TEMPERATURE,
+    ThermocyclerModuleModel: ModuleType.THERMOCYCLER,
+    HeaterShakerModuleModel: ModuleType.HEATER_SHAKER,
+    MagneticBlockModel: ModuleType.MAGNETIC_BLOCK,
+    AbsorbanceReaderModel: ModuleType.ABSORBANCE_READER,
+}
+
+_MODULE_FIXTURE_ID_BY_TYPE: Dict[ModuleType, str] = {
+    # Thermocyclers are "loaded" in B1 only
+    ModuleType.THERMOCYCLER: "thermocyclerModuleV2Front",
+    ModuleType.TEMPERATURE: "temperatureModuleV2",
+    ModuleType.HEATER_SHAKER: "heaterShakerModuleV1",
+    ModuleType.MAGNETIC_BLOCK: "magneticBlockV1",
+    ModuleType.ABSORBANCE_READER: "absorbanceReaderV1",
+}
+
+_MODULE_MODELS_BY_VALUE: Dict[str, ModuleModel] = {
+    model.value: model
+    for model_enum in (
         TemperatureModuleModel,
+        MagneticModuleModel,
         ThermocyclerModuleModel,
         HeaterShakerModuleModel,
         MagneticBlockModel,
         AbsorbanceReaderModel,
-    }:
-        try:
-            return cast(ModuleModel, model_enum(model_string))
-        except ValueError:
-            pass
-    raise ValueError(f"No such module model {model_string}")
+    )
+    for model in cast("Tuple[ModuleModel, ...]", tuple(model_enum))
+}
+
+
+def module_model_from_string(model_string: str) -> ModuleModel:
+    model = _MODULE_MODELS_BY_VALUE.get(model_string)
+    if model is None:
+        raise ValueError(f"No such module model {model_string}")
+    return model
 
 
 @dataclass(kw_only=True)
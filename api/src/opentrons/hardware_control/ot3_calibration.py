@@ -9,7 +9,7 @@ import numpy as np
 from enum import Enum
 from math import floor, copysign
 from logging import getLogger
-from opentrons.util.linal import solve_attitude, SolvePoints, DoubleMatrix
+from opentrons.util.linal import is_singular3, solve_attitude, SolvePoints, DoubleMatrix
 
 from .types import OT3Mount, Axis, GripperProbe
 from opentrons.types import Point
@@ -961,14 +961,28 @@ def apply_machine_transform(
     return deck_attitude  # type: ignore[no-any-return]
 
 
+@lru_cache(maxsize=1)
+def _default_deck_attitude() -> Tuple[Tuple[float, ...], ...]:
+    return tuple(
+        tuple(row) for row in apply_machine_transform(default_ot3_deck_calibration())
+    )
+
+
 def load_attitude_matrix(to_default: bool = True) -> DeckCalibration:
-    calibration_data = get_robot_belt_attitude()
+    # The default attitude does not depend on anything stored on the robot,
+    # so there is no need to read the belt calibration file to build it
+    calibration_data = None if to_default else get_robot_belt_attitude()
 
-    if calibration_data and not to_default:
+    if calibration_data:
+        status = calibration_data.status
         return DeckCalibration(
             attitude=apply_machine_transform(calibration_data.attitude),
             source=calibration_data.source,
-            status=types.CalibrationStatus(**calibration_data.status.dict()),
+            status=types.CalibrationStatus(
+                markedBad=status.markedBad,
+                source=status.source,
+                markedAt=status.markedAt,
+            ),
             belt_attitude=calibration_data.attitude,
             last_modified=calibration_data.lastModified,
             pipette_calibrated_with=calibration_data.pipetteCalibratedWith,
@@ -976,7 +990,7 @@ def load_attitude_matrix(to_default: bool = True) -> DeckCalibration:
     else:
         # load default if calibration data does not exist
         return DeckCalibration(
-            attitude=apply_machine_transform(default_ot3_deck_calibration()),
+            attitude=[list(row) for row in _default_deck_attitude()],
             source=types.SourceType.default,
             status=types.CalibrationStatus(),
             belt_attitude=default_ot3_deck_calibration(),
@@ -993,10 +1007,7 @@ def validate_attitude_deck_calibration(
     TODO(pm, 5/9/2023): As with the OT2, expand on this method,
     or create another method to diagnose bad instrument offset data
     """
-    curr_cal: DoubleMatrix = np.array(deck_cal.attitude)
-    row, _ = curr_cal.shape
-    rank: int = np.linalg.matrix_rank(curr_cal)
-    if row != rank:
+    if is_singular3(deck_cal.attitude):
         # Check that the matrix is non-singular
         return DeckTransformState.SINGULARITY
     elif not deck_cal.last_modified:
@@ -1022,52 +1033,52 @@ class OT3RobotCalibrationProvider:
     def __init__(self, config: OT3Config) -> None:
         self._robot_calibration = OT3Transforms(
             deck_calibration=load_attitude_matrix(to_default=False),
-            carriage_offset=Point(*config.carriage_offset),
-            left_mount_offset=Point(*config.left_mount_offset),
-            right_mount_offset=Point(*config.right_mount_offset),
-            gripper_mount_offset=Point(*config.gripper_mount_offset),
+            carriage_offset=Point._make(config.carriage_offset),
+            left_mount_offset=Point._make(config.left_mount_offset),
+            right_mount_offset=Point._make(config.right_mount_offset),
+            gripper_mount_offset=Point._make(config.gripper_mount_offset),
         )
+        self._validated_state: Optional[DeckTransformState] = None
 
-    @lru_cache(1)
     def _validate(self) -> DeckTransformState:
-        return validate_attitude_deck_calibration(
-            self._robot_calibration.deck_calibration
-        )
+        if self._validated_state is None:
+            self._validated_state = validate_attitude_deck_calibration(
+                self._robot_calibration.deck_calibration
+            )
+        return self._validated_state
 
     @property
     def robot_calibration(self) -> OT3Transforms:
         return self._robot_calibration
 
     def reset_robot_calibration(self) -> None:
-        self._validate.cache_clear()
+        self._validated_state = None
         self._robot_calibration = OT3Transforms(
             deck_calibration=load_attitude_matrix(to_default=True),
-            carriage_offset=Point(*defaults_ot3.DEFAULT_CARRIAGE_OFFSET),
-            left_mount_offset=Point(*defaults_ot3.DEFAULT_LEFT_MOUNT_OFFSET),
-            right_mount_offset=Point(*defaults_ot3.DEFAULT_RIGHT_MOUNT_OFFSET),
-            gripper_mount_offset=Point(*defaults_ot3.DEFAULT_GRIPPER_MOUNT_OFFSET),
+            carriage_offset=Point._make(defaults_ot3.DEFAULT_CARRIAGE_OFFSET),
+            left_mount_offset=Point._make(defaults_ot3.DEFAULT_LEFT_MOUNT_OFFSET),
+            right_mount_offset=Point._make(defaults_ot3.DEFAULT_RIGHT_MOUNT_OFFSET),
+            gripper_mount_offset=Point._make(defaults_ot3.DEFAULT_GRIPPER_MOUNT_OFFSET),
         )
 
     def reset_deck_calibration(self) -> None:
+        self._validated_state = None
         self._robot_calibration.deck_calibration = load_attitude_matrix(to_default=True)
 
     def load_deck_calibration(self) -> None:
-        self._validate.cache_clear()
+        self._validated_state = None
         self._robot_calibration.deck_calibration = load_attitude_matrix(
             to_default=False
         )
 
     def set_robot_calibration(self, robot_calibration: OT3Transforms) -> None:
-        self._validate.cache_clear()
+        self._validated_state = None
         self._robot_calibration = robot_calibration
 
     def validate_calibration(self) -> DeckTransformState:
         """
-        The lru cache decorator is currently not supported by the
-        ThreadManager. To work around this, we need to wrap the
-        actual function around a dummy outer function.
-
-        Once decorators are more fully supported, we can remove this.
+        Check the current deck calibration, reusing the result until the
+        robot calibration is changed or reloaded.
         """
         return self._validate()
 
@@ -1078,14 +1089,14 @@ class OT3RobotCalibrationProvider:
         """
         return OT3Transforms(
             deck_calibration=load_attitude_matrix(to_default=True),
-            carriage_offset=Point(*defaults_ot3.DEFAULT_CARRIAGE_OFFSET),
-            left_mount_offset=Point(*defaults_ot3.DEFAULT_LEFT_MOUNT_OFFSET),
-            right_mount_offset=Point(*defaults_ot3.DEFAULT_RIGHT_MOUNT_OFFSET),
-            gripper_mount_offset=Point(*defaults_ot3.DEFAULT_GRIPPER_MOUNT_OFFSET),
+            carriage_offset=Point._make(defaults_ot3.DEFAULT_CARRIAGE_OFFSET),
+            left_mount_offset=Point._make(defaults_ot3.DEFAULT_LEFT_MOUNT_OFFSET),
+            right_mount_offset=Point._make(defaults_ot3.DEFAULT_RIGHT_MOUNT_OFFSET),
+            gripper_mount_offset=Point._make(defaults_ot3.DEFAULT_GRIPPER_MOUNT_OFFSET),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class OT3Transforms(RobotCalibration):
     carriage_offset: Point
     left_mount_offset: Point
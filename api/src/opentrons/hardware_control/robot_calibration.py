@@ -1,10 +1,8 @@
-from functools import lru_cache
 import logging
 import numpy as np
 from datetime import datetime
 from dataclasses import dataclass
-from typing import Optional, List, Any, cast
-from numpy.typing import NDArray
+from typing import Optional, List, Tuple
 
 from opentrons import config
 
@@ -24,7 +22,7 @@ from .util import DeckTransformState
 log = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class DeckCalibration:
     attitude: types.AttitudeMatrix
     source: types.SourceType
@@ -35,11 +33,24 @@ class DeckCalibration:
     tiprack: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RobotCalibration:
     deck_calibration: DeckCalibration
 
 
+# Identity matrices a legacy gantry calibration may hold: the 3x3 deck
+# transform, or the full 4x4 affine transform that gantry calibrations use
+_IDENTITY_GANTRY_TRANSFORMS: Tuple[List[List[float]], ...] = (
+    linal.identity_deck_transform().tolist(),
+    [
+        [1.0, 0.0, 0.0, 0.0],
+        [0.0, 1.0, 0.0, 0.0],
+        [0.0, 0.0, 1.0, 0.0],
+        [0.0, 0.0, 0.0, 1.0],
+    ],
+)
+
+
 def validate_attitude_deck_calibration(
     deck_cal: DeckCalibration,
 ) -> DeckTransformState:
@@ -50,10 +61,7 @@ def validate_attitude_deck_calibration(
     TODO(lc, 8/10/2020): As with the OT2, expand on this method, or create
     another method to diagnose bad instrument offset data
     """
-    curr_cal: linal.DoubleMatrix = np.array(deck_cal.attitude)
-    row, _ = curr_cal.shape
-    rank: int = np.linalg.matrix_rank(curr_cal)
-    if row != rank:
+    if linal.is_singular3(deck_cal.attitude):
         # Check that the matrix is non-singular
         return DeckTransformState.SINGULARITY
     elif not deck_cal.last_modified:
@@ -69,23 +77,20 @@ def validate_gantry_calibration(gantry_cal: List[List[float]]) -> DeckTransformS
     This function determines whether the gantry calibration is valid
     or not based on the following use-cases:
     """
-    curr_cal: linal.DoubleMatrix = np.array(gantry_cal)
-    row, _ = curr_cal.shape
-
-    rank: int = np.linalg.matrix_rank(curr_cal)
+    if gantry_cal in _IDENTITY_GANTRY_TRANSFORMS:
+        # Check that the matrix is not an identity. An identity is never
+        # singular, so this can be decided before touching numpy.
+        return DeckTransformState.IDENTITY
 
-    id_matrix = linal.identity_deck_transform()
+    curr_cal: linal.DoubleMatrix = np.asarray(gantry_cal, dtype=np.float64)
+    if linal.is_singular(curr_cal):
+        # Check that the matrix is square and non-singular
+        return DeckTransformState.SINGULARITY
 
-    z = abs(curr_cal[2][-1])
+    z = abs(gantry_cal[2][-1])
 
     outofrange = z < 16 or z > 34
-    if row != rank:
-        # Check that the matrix is non-singular
-        return DeckTransformState.SINGULARITY
-    elif np.array_equal(curr_cal, id_matrix):
-        # Check that the matrix is not an identity
-        return DeckTransformState.IDENTITY
-    elif outofrange:
+    if outofrange:
         # Check that the matrix is not out of range.
         return DeckTransformState.BAD_CALIBRATION
     else:
@@ -96,24 +101,13 @@ def validate_gantry_calibration(gantry_cal: List[List[float]]) -> DeckTransformS
 def migrate_affine_xy_to_attitude(
     gantry_cal: List[List[float]],
 ) -> types.AttitudeMatrix:
-    masked_transform: NDArray[np.bool_] = np.array(
-        [
-            [True, True, True, False],
-            [True, True, True, False],
-            [False, False, False, False],
-            [False, False, False, False],
-        ]
-    )
-    masked_array: np.ma.MaskedArray[
-        Any, np.dtype[np.float64]
-    ] = np.ma.masked_array(  # type: ignore
-        gantry_cal, ~masked_transform
-    )
-    attitude_array: linal.DoubleMatrix = np.zeros((3, 3))
-    np.put(attitude_array, [0, 1, 2], masked_array[0].compressed())
-    np.put(attitude_array, [3, 4, 5], masked_array[1].compressed())
-    np.put(attitude_array, 8, 1)
-    return cast(List[List[float]], attitude_array.tolist())
+    """Keep the x and y rows of a legacy affine transform as a deck attitude."""
+    x_row, y_row = gantry_cal[0], gantry_cal[1]
+    return [
+        [float(x_row[0]), float(x_row[1]), float(x_row[2])],
+        [float(y_row[0]), float(y_row[1]), float(y_row[2])],
+        [0.0, 0.0, 1.0],
+    ]
 
 
 def save_attitude_matrix(
@@ -151,10 +145,15 @@ def load_attitude_matrix() -> DeckCalibration:
             calibration_data = get_robot_deck_attitude()
 
     if calibration_data:
+        status = calibration_data.status
         return DeckCalibration(
             attitude=calibration_data.attitude,
             source=calibration_data.source,
-            status=types.CalibrationStatus(**calibration_data.status.dict()),
+            status=types.CalibrationStatus(
+                markedBad=status.markedBad,
+                source=status.source,
+                markedAt=status.markedAt,
+            ),
             last_modified=calibration_data.last_modified,
             pipette_calibrated_with=calibration_data.pipette_calibrated_with,
             tiprack=calibration_data.tiprack,
@@ -175,38 +174,39 @@ def load() -> RobotCalibration:
 class RobotCalibrationProvider:
     def __init__(self) -> None:
         self._robot_calibration = load()
+        self._validated_state: Optional[DeckTransformState] = None
 
-    @lru_cache(1)
     def _validate(self) -> DeckTransformState:
-        return validate_attitude_deck_calibration(
-            self._robot_calibration.deck_calibration
-        )
+        if self._validated_state is None:
+            self._validated_state = validate_attitude_deck_calibration(
+                self._robot_calibration.deck_calibration
+            )
+        return self._validated_state
 
     @property
     def robot_calibration(self) -> RobotCalibration:
         return self._robot_calibration
 
     def reset_robot_calibration(self) -> None:
-        self._validate.cache_clear()
+        self._validated_state = None
         self._robot_calibration = load()
 
     def reset_deck_calibration(self) -> None:
+        self._validated_state = None
         self._robot_calibration = load()
 
     def load_deck_calibration(self) -> None:
+        self._validated_state = None
         self._robot_calibration = load()
 
     def set_robot_calibration(self, robot_calibration: RobotCalibration) -> None:
-        self._validate.cache_clear()
+        self._validated_state = None
         self._robot_calibration = robot_calibration
 
     def validate_calibration(self) -> DeckTransformState:
         """
-        The lru cache decorator is currently not supported by the
-        ThreadManager. To work around this, we need to wrap the
-        actual function around a dummy outer function.
-
-        Once decorators are more fully supported, we can remove this.
+        Check the current deck calibration, reusing the result until the
+        robot calibration is changed or reloaded.
         """
         return self._validate()
 
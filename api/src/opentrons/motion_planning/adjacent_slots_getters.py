@@ -1,6 +1,7 @@
 """Getters for specific adjacent slots."""
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Union
+from functools import lru_cache
+from typing import Optional, List, Dict, Tuple, Union
 
 from opentrons_shared_data.robot.dev_types import RobotType
 
@@ -83,6 +84,18 @@ class _MixedTypeSlots:
 
 def get_surrounding_slots(slot: int, robot_type: RobotType) -> _MixedTypeSlots:
     """Get all the surrounding slots, i.e., adjacent slots as well as corner slots."""
+    regular_slots, staging_slots = _get_surrounding_slot_names(slot, robot_type)
+    return _MixedTypeSlots(
+        regular_slots=list(regular_slots), staging_slots=list(staging_slots)
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_surrounding_slot_names(
+    slot: int, robot_type: RobotType
+) -> Tuple[Tuple[DeckSlotName, ...], Tuple[StagingSlotName, ...]]:
+    # The deck layout is fixed, so there are only a couple dozen distinct
+    # answers; compute each of them once.
     corner_slots: List[Union[int, None]] = [
         get_north_east_slot(slot),
         get_north_west_slot(slot),
@@ -93,16 +106,17 @@ def get_surrounding_slots(slot: int, robot_type: RobotType) -> _MixedTypeSlots:
     surrounding_regular_slots_int = get_adjacent_slots(slot) + [
         maybe_slot for maybe_slot in corner_slots if maybe_slot is not None
     ]
-    surrounding_regular_slots = [
+    surrounding_regular_slots = tuple(
         DeckSlotName.from_primitive(slot_int).to_equivalent_for_robot_type(robot_type)
         for slot_int in surrounding_regular_slots_int
-    ]
-    surrounding_staging_slots = _SURROUNDING_STAGING_SLOTS_MAP.get(
-        DeckSlotName.from_primitive(slot).to_equivalent_for_robot_type(robot_type), []
     )
-    return _MixedTypeSlots(
-        regular_slots=surrounding_regular_slots, staging_slots=surrounding_staging_slots
+    surrounding_staging_slots = tuple(
+        _SURROUNDING_STAGING_SLOTS_MAP.get(
+            DeckSlotName.from_primitive(slot).to_equivalent_for_robot_type(robot_type),
+            [],
+        )
     )
+    return surrounding_regular_slots, surrounding_staging_slots
 
 
 _WEST_OF_STAGING_SLOT_MAP: Dict[StagingSlotName, DeckSlotName] = {
@@ -1,20 +1,23 @@
 """A Protocol-Engine-friendly wrapper for opentrons.motion_planning.deck_conflict."""
 from __future__ import annotations
-import itertools
 import logging
 from typing import (
+    Callable,
     Collection,
     Dict,
+    Iterable,
     Optional,
     Tuple,
     overload,
     Union,
     TYPE_CHECKING,
+    TypeVar,
     List,
 )
 
 from opentrons_shared_data.errors.exceptions import MotionPlanningFailureError
 from opentrons_shared_data.module import FLEX_TC_LID_COLLISION_ZONE
+from opentrons_shared_data.robot.dev_types import RobotType
 
 from opentrons.hardware_control.nozzle_manager import NozzleConfigurationType
 from opentrons.hardware_control.modules.types import ModuleType
@@ -24,14 +27,11 @@ from opentrons.motion_planning import adjacent_slots_getters
 from opentrons.protocol_engine import (
     StateView,
     DeckSlotLocation,
-    ModuleLocation,
     OnLabwareLocation,
     AddressableAreaLocation,
-    OFF_DECK_LOCATION,
     WellLocation,
     DropTipWellLocation,
 )
-from opentrons.protocol_engine.errors.exceptions import LabwareNotLoadedOnModuleError
 from opentrons.protocol_engine.types import (
     StagingSlotLocation,
 )
@@ -63,6 +63,8 @@ class UnsuitableTiprackForPipetteMotion(MotionPlanningFailureError):
 
 _log = logging.getLogger(__name__)
 
+_ItemT = TypeVar("_ItemT")
+
 # TODO (spp, 2023-12-06): move this to a location like motion planning where we can
 #  derive these values from geometry definitions
 #  Also, verify y-axis extents values for the nozzle columns.
@@ -173,32 +175,21 @@ def check(
 
     new_location, new_item = new_location_and_item
 
-    all_existing_labware = (
-        _map_labware(engine_state, labware_id) for labware_id in existing_labware_ids
-    )
-    mapped_existing_labware = (m for m in all_existing_labware if m is not None)
-
-    all_existing_modules = (
-        _map_module(engine_state, module_id) for module_id in existing_module_ids
-    )
-    mapped_existing_modules = (m for m in all_existing_modules if m is not None)
-
-    all_exisiting_disposal_locations = (
-        _map_disposal_location(disposal_location)
-        for disposal_location in existing_disposal_locations
-    )
-    mapped_disposal_locations = (
-        m for m in all_exisiting_disposal_locations if m is not None
-    )
-
     existing_items: Dict[
         Union[DeckSlotName, StagingSlotName], wrapped_deck_conflict.DeckItem
     ] = {}
-    for existing_location, existing_item in itertools.chain(
-        mapped_existing_labware, mapped_existing_modules, mapped_disposal_locations
-    ):
-        assert existing_location not in existing_items
-        existing_items[existing_location] = existing_item
+
+    _add_mapped(
+        existing_items,
+        existing_labware_ids,
+        lambda labware_id: _map_labware(engine_state, labware_id),
+    )
+    _add_mapped(
+        existing_items,
+        existing_module_ids,
+        lambda module_id: _map_module(engine_state, module_id),
+    )
+    _add_mapped(existing_items, existing_disposal_locations, _map_disposal_location)
 
     wrapped_deck_conflict.check(
         existing_items=existing_items,
@@ -228,38 +219,45 @@ def check_safe_for_pipette_movement(
     # TODO (spp, 2023-02-06): remove this check after thorough testing.
     #  This function is capable of checking for movement conflict regardless of
     #  nozzle configuration.
-    if not engine_state.pipettes.get_is_partially_configured(pipette_id):
+    pipettes = engine_state.pipettes
+    if not pipettes.get_is_partially_configured(pipette_id):
         return
 
+    geometry = engine_state.geometry
     if isinstance(well_location, DropTipWellLocation):
         # convert to WellLocation
-        well_location = engine_state.geometry.get_checked_tip_drop_location(
+        well_location = geometry.get_checked_tip_drop_location(
             pipette_id=pipette_id,
             labware_id=labware_id,
             well_location=well_location,
             partially_configured=True,
         )
-    well_location_point = engine_state.geometry.get_well_position(
+    well_location_point = geometry.get_well_position(
         labware_id=labware_id, well_name=well_name, well_location=well_location
     )
-    primary_nozzle = engine_state.pipettes.get_primary_nozzle(pipette_id)
+    primary_nozzle = pipettes.get_primary_nozzle(pipette_id)
+    robot_type = engine_state.config.robot_type
 
     if not _is_within_pipette_extents(
-        engine_state=engine_state, pipette_id=pipette_id, location=well_location_point
+        engine_state=engine_state,
+        pipette_id=pipette_id,
+        location=well_location_point,
+        robot_type=robot_type,
+        primary_nozzle=primary_nozzle,
     ):
         raise PartialTipMovementNotAllowedError(
             f"Requested motion with the {primary_nozzle} nozzle partial configuration"
             f" is outside of robot bounds for the pipette."
         )
 
-    labware_slot = engine_state.geometry.get_ancestor_slot_name(labware_id)
+    labware_slot = geometry.get_ancestor_slot_name(labware_id)
     pipette_bounds_at_well_location = (
-        engine_state.pipettes.get_pipette_bounds_at_specified_move_to_position(
+        pipettes.get_pipette_bounds_at_specified_move_to_position(
             pipette_id=pipette_id, destination_position=well_location_point
         )
     )
     surrounding_slots = adjacent_slots_getters.get_surrounding_slots(
-        slot=labware_slot.as_int(), robot_type=engine_state.config.robot_type
+        slot=labware_slot.as_int(), robot_type=robot_type
     )
 
     if _will_collide_with_thermocycler_lid(
@@ -429,12 +427,12 @@ def _is_within_pipette_extents(
     engine_state: StateView,
     pipette_id: str,
     location: Point,
+    robot_type: RobotType,
+    primary_nozzle: Optional[str],
 ) -> bool:
     """Whether a given point is within the extents of a configured pipette on the specified robot."""
-    robot_type = engine_state.config.robot_type
     pipette_channels = engine_state.pipettes.get_channels(pipette_id)
     nozzle_config = engine_state.pipettes.get_nozzle_layout_type(pipette_id)
-    primary_nozzle = engine_state.pipettes.get_primary_nozzle(pipette_id)
     if robot_type == "OT-3 Standard":
         if pipette_channels == 96 and nozzle_config == NozzleConfigurationType.COLUMN:
             # TODO (spp, 2023-12-18): change this eventually to use column mappings in
@@ -461,6 +459,30 @@ def _is_within_pipette_extents(
     return True
 
 
+def _add_mapped(
+    existing_items: Dict[
+        Union[DeckSlotName, StagingSlotName], wrapped_deck_conflict.DeckItem
+    ],
+    items: Iterable[_ItemT],
+    mapper: Callable[
+        [_ItemT],
+        Optional[
+            Tuple[Union[DeckSlotName, StagingSlotName], wrapped_deck_conflict.DeckItem]
+        ],
+    ],
+) -> None:
+    """Map each item onto the deck and add it to existing_items.
+
+    Items that the mapper excludes from deck conflict checking are skipped.
+    """
+    for item in items:
+        mapped = mapper(item)
+        if mapped is not None:
+            location, deck_item = mapped
+            assert location not in existing_items
+            existing_items[location] = deck_item
+
+
 def _map_labware(
     engine_state: StateView,
     labware_id: str,
@@ -469,63 +491,42 @@ def _map_labware(
 ]:
     location_from_engine = engine_state.labware.get_location(labware_id=labware_id)
 
-    if isinstance(location_from_engine, AddressableAreaLocation):
+    slot: Union[DeckSlotName, StagingSlotName]
+    if isinstance(location_from_engine, DeckSlotLocation):
+        # This labware is loaded directly into a deck slot.
+        slot = location_from_engine.slotName
+
+    elif isinstance(location_from_engine, AddressableAreaLocation):
         # This will be guaranteed to be either deck slot name or staging slot name
-        slot: Union[DeckSlotName, StagingSlotName]
         try:
             slot = DeckSlotName.from_primitive(location_from_engine.addressableAreaName)
         except ValueError:
             slot = StagingSlotName.from_primitive(
                 location_from_engine.addressableAreaName
             )
-        return (
-            slot,
-            wrapped_deck_conflict.Labware(
-                name_for_errors=engine_state.labware.get_load_name(
-                    labware_id=labware_id
-                ),
-                highest_z=engine_state.geometry.get_labware_highest_z(
-                    labware_id=labware_id
-                ),
-                uri=engine_state.labware.get_definition_uri(labware_id=labware_id),
-                is_fixed_trash=engine_state.labware.is_fixed_trash(
-                    labware_id=labware_id
-                ),
-            ),
-        )
-
-    elif isinstance(location_from_engine, DeckSlotLocation):
-        # This labware is loaded directly into a deck slot.
-        # Map it to a wrapped_deck_conflict.Labware.
-        return (
-            location_from_engine.slotName,
-            wrapped_deck_conflict.Labware(
-                name_for_errors=engine_state.labware.get_load_name(
-                    labware_id=labware_id
-                ),
-                highest_z=engine_state.geometry.get_labware_highest_z(
-                    labware_id=labware_id
-                ),
-                uri=engine_state.labware.get_definition_uri(labware_id=labware_id),
-                is_fixed_trash=engine_state.labware.is_fixed_trash(
-                    labware_id=labware_id
-                ),
-            ),
-        )
 
-    elif isinstance(location_from_engine, ModuleLocation):
-        # This labware is loaded atop a module. Don't map it to anything here;
-        # let _map_module() pick it up.
-        return None
-
-    elif isinstance(location_from_engine, OnLabwareLocation):
-        # TODO(jbl 2023-06-08) check if we need to do any logic here or if this is correct
+    else:
+        # ModuleLocation: this labware is loaded atop a module. Don't map it to
+        # anything here; let _map_module() pick it up.
+        # OnLabwareLocation: TODO(jbl 2023-06-08) check if we need to do any logic
+        # here or if this is correct.
+        # OFF_DECK_LOCATION: this labware is off-deck. Exclude it from conflict
+        # checking.
+        # todo(mm, 2023-02-23): Move the off-deck logic into wrapped_deck_conflict.
         return None
 
-    elif location_from_engine == OFF_DECK_LOCATION:
-        # This labware is off-deck. Exclude it from conflict checking.
-        # todo(mm, 2023-02-23): Move this logic into wrapped_deck_conflict.
-        return None
+    # Map it to a wrapped_deck_conflict.Labware.
+    return (
+        slot,
+        wrapped_deck_conflict.Labware(
+            name_for_errors=engine_state.labware.get_load_name(labware_id=labware_id),
+            highest_z=engine_state.geometry.get_labware_highest_z(
+                labware_id=labware_id
+            ),
+            uri=engine_state.labware.get_definition_uri(labware_id=labware_id),
+            is_fixed_trash=engine_state.labware.is_fixed_trash(labware_id=labware_id),
+        ),
+    )
 
 
 def _map_module(
@@ -597,16 +598,11 @@ def _map_disposal_location(
         return None
 
 
-def _deck_slot_to_int(deck_slot_location: DeckSlotLocation) -> int:
-    return deck_slot_location.slotName.as_int()
-
-
 def _get_module_highest_z_including_labware(
     engine_state: StateView, module_id: str
 ) -> float:
-    try:
-        labware_id = engine_state.labware.get_id_by_module(module_id=module_id)
-    except LabwareNotLoadedOnModuleError:
+    labware_id = engine_state.labware.find_id_by_module(module_id=module_id)
+    if labware_id is None:
         # No labware is loaded atop this module.
         # The height should be just the module itself.
         return engine_state.modules.get_overall_height(module_id=module_id)
@@ -14,7 +14,6 @@ from opentrons_shared_data.pipette.dev_types import ChannelCount
 from .. import errors
 from ..errors import (
     LabwareNotLoadedOnLabwareError,
-    LabwareNotLoadedOnModuleError,
     LabwareMovementNotAllowedError,
 )
 from ..resources import fixture_validation
@@ -162,9 +161,8 @@ class GeometryView:
         if isinstance(slot_item, LoadedModule):
             # get height of module + all labware on it
             module_id = slot_item.id
-            try:
-                labware_id = self._labware.get_id_by_module(module_id=module_id)
-            except LabwareNotLoadedOnModuleError:
+            labware_id = self._labware.find_id_by_module(module_id=module_id)
+            if labware_id is None:
                 return self._modules.get_module_highest_z(
                     module_id=module_id,
                     addressable_areas=self._addressable_areas,
@@ -258,18 +258,24 @@ class LabwareView(HasState[LabwareState]):
                 f"Labware {labware_id} not found."
             ) from e
 
-    def get_id_by_module(self, module_id: str) -> str:
-        """Return the ID of the labware loaded on the given module."""
+    def find_id_by_module(self, module_id: str) -> Optional[str]:
+        """Return the ID of the labware loaded on the given module, if any."""
         for labware_id, labware in self.state.labware_by_id.items():
             if (
                 isinstance(labware.location, ModuleLocation)
                 and labware.location.moduleId == module_id
             ):
                 return labware_id
+        return None
 
-        raise errors.exceptions.LabwareNotLoadedOnModuleError(
-            "There is no labware loaded on this Module"
-        )
+    def get_id_by_module(self, module_id: str) -> str:
+        """Return the ID of the labware loaded on the given module."""
+        labware_id = self.find_id_by_module(module_id)
+        if labware_id is None:
+            raise errors.exceptions.LabwareNotLoadedOnModuleError(
+                "There is no labware loaded on this Module"
+            )
+        return labware_id
 
     def get_id_by_labware(self, labware_id: str) -> str:
         """Return the ID of the labware loaded on the given labware."""
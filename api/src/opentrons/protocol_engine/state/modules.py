@@ -797,23 +797,10 @@ class ModuleView(HasState[ModuleState]):
                     1,
                 )
             )
-            xforms_ser = definition.slotTransforms.get(
-                str(self._state.deck_type.value), {}
-            ).get(
-                slot,
-                {
-                    "labwareOffset": [
-                        [1, 0, 0, 0],
-                        [0, 1, 0, 0],
-                        [0, 0, 1, 0],
-                        [0, 0, 0, 1],
-                    ]
-                },
-            )
-            xforms_ser_offset = xforms_ser["labwareOffset"]
-
             # Apply the slot transform, if any
-            xform: NDArray[npdouble] = array(xforms_ser_offset)
+            xform = definition.get_labware_offset_transform(
+                str(self._state.deck_type.value), slot
+            )
             xformed = dot(xform, pre_transform)
             return LabwareOffsetVector(
                 x=xformed[0],
@@ -4,9 +4,12 @@ import re
 from datetime import datetime
 from enum import Enum
 from dataclasses import dataclass
+import numpy as np
+from numpy.typing import NDArray
 from pydantic import (
     BaseModel,
     Field,
+    PrivateAttr,
     StrictBool,
     StrictFloat,
     StrictInt,
@@ -318,41 +321,28 @@ class ModuleModel(str, Enum):
 
     def as_type(self) -> ModuleType:
         """Get the ModuleType of this model."""
-        if ModuleModel.is_temperature_module_model(self):
-            return ModuleType.TEMPERATURE
-        elif ModuleModel.is_magnetic_module_model(self):
-            return ModuleType.MAGNETIC
-        elif ModuleModel.is_thermocycler_module_model(self):
-            return ModuleType.THERMOCYCLER
-        elif ModuleModel.is_heater_shaker_module_model(self):
-            return ModuleType.HEATER_SHAKER
-        elif ModuleModel.is_magnetic_block(self):
-            return ModuleType.MAGNETIC_BLOCK
-        elif ModuleModel.is_absorbance_reader(self):
-            return ModuleType.ABSORBANCE_READER
-
-        assert False, f"Invalid ModuleModel {self}"
+        return _MODULE_TYPE_BY_MODEL[self]
 
     @classmethod
     def is_temperature_module_model(
         cls, model: ModuleModel
     ) -> TypeGuard[TemperatureModuleModel]:
         """Whether a given model is a Temperature Module."""
-        return model in [cls.TEMPERATURE_MODULE_V1, cls.TEMPERATURE_MODULE_V2]
+        return model in _TEMPERATURE_MODULE_MODELS
 
     @classmethod
     def is_magnetic_module_model(
         cls, model: ModuleModel
     ) -> TypeGuard[MagneticModuleModel]:
         """Whether a given model is a Magnetic Module."""
-        return model in [cls.MAGNETIC_MODULE_V1, cls.MAGNETIC_MODULE_V2]
+        return model in _MAGNETIC_MODULE_MODELS
 
     @classmethod
     def is_thermocycler_module_model(
         cls, model: ModuleModel
     ) -> TypeGuard[ThermocyclerModuleModel]:
         """Whether a given model is a Thermocycler Module."""
-        return model in [cls.THERMOCYCLER_MODULE_V1, cls.THERMOCYCLER_MODULE_V2]
+        return model in _THERMOCYCLER_MODULE_MODELS
 
     @classmethod
     def is_heater_shaker_module_model(
@@ -387,6 +377,26 @@ HeaterShakerModuleModel = Literal[ModuleModel.HEATER_SHAKER_MODULE_V1]
 MagneticBlockModel = Literal[ModuleModel.MAGNETIC_BLOCK_V1]
 AbsorbanceReaderModel = Literal[ModuleModel.ABSORBANCE_READER_V1]
 
+_TEMPERATURE_MODULE_MODELS: FrozenSet[ModuleModel] = frozenset(
+    [ModuleModel.TEMPERATURE_MODULE_V1, ModuleModel.TEMPERATURE_MODULE_V2]
+)
+_MAGNETIC_MODULE_MODELS: FrozenSet[ModuleModel] = frozenset(
+    [ModuleModel.MAGNETIC_MODULE_V1, ModuleModel.MAGNETIC_MODULE_V2]
+)
+_THERMOCYCLER_MODULE_MODELS: FrozenSet[ModuleModel] = frozenset(
+    [ModuleModel.THERMOCYCLER_MODULE_V1, ModuleModel.THERMOCYCLER_MODULE_V2]
+)
+
+# Every ModuleModel member has an entry.
+_MODULE_TYPE_BY_MODEL: Dict[ModuleModel, ModuleType] = {
+    **{model: ModuleType.TEMPERATURE for model in _TEMPERATURE_MODULE_MODELS},
+    **{model: ModuleType.MAGNETIC for model in _MAGNETIC_MODULE_MODELS},
+    **{model: ModuleType.THERMOCYCLER for model in _THERMOCYCLER_MODULE_MODELS},
+    ModuleModel.HEATER_SHAKER_MODULE_V1: ModuleType.HEATER_SHAKER,
+    ModuleModel.MAGNETIC_BLOCK_V1: ModuleType.MAGNETIC_BLOCK,
+    ModuleModel.ABSORBANCE_READER_V1: ModuleType.ABSORBANCE_READER,
+}
+
 
 class ModuleDimensions(BaseModel):
     """Dimension type for modules."""
@@ -425,7 +435,8 @@ class LabwareOffsetVector(BaseModel):
         """Adds two vectors together."""
         if not isinstance(other, LabwareOffsetVector):
             return NotImplemented
-        return LabwareOffsetVector(
+        # Both operands are already validated, so the result can skip validation.
+        return LabwareOffsetVector.construct(
             x=self.x + other.x, y=self.y + other.y, z=self.z + other.z
         )
 
@@ -433,7 +444,8 @@ class LabwareOffsetVector(BaseModel):
         """Subtracts two vectors."""
         if not isinstance(other, LabwareOffsetVector):
             return NotImplemented
-        return LabwareOffsetVector(
+        # Both operands are already validated, so the result can skip validation.
+        return LabwareOffsetVector.construct(
             x=self.x - other.x, y=self.y - other.y, z=self.z - other.z
         )
 
@@ -542,6 +554,48 @@ class ModuleDefinition(BaseModel):
         description="Offsets to use for labware movement using gripper",
     )
 
+    _labware_offset_transforms: Dict[Tuple[str, str], NDArray[np.double]] = PrivateAttr(
+        default_factory=dict
+    )
+    # The slotTransforms object that _labware_offset_transforms was parsed from.
+    _labware_offset_transforms_source: Optional[Dict[str, Any]] = PrivateAttr(
+        default=None
+    )
+
+    def get_labware_offset_transform(
+        self, deck_type: str, slot: str
+    ) -> NDArray[np.double]:
+        """Get the 4x4 labware offset transform for a deck type and slot.
+
+        The parsed matrix is cached on this definition, so it is only built from
+        ``slotTransforms`` once. Legacy 3x3 matrices are embedded in the identity,
+        and slots without a transform get the identity. The returned array is
+        read-only.
+
+        The cache is dropped whenever ``slotTransforms`` is replaced, for example
+        by ``.copy(update=...)``, which otherwise carries private attributes over.
+        """
+        if self._labware_offset_transforms_source is not self.slotTransforms:
+            # Assign a new dict rather than clearing, since copies share the old one.
+            self._labware_offset_transforms = {}
+            self._labware_offset_transforms_source = self.slotTransforms
+
+        key = (deck_type, slot)
+        try:
+            return self._labware_offset_transforms[key]
+        except KeyError:
+            pass
+
+        transform = np.identity(4, dtype=np.float64)
+        slot_transforms = self.slotTransforms.get(deck_type, {}).get(slot)
+        if slot_transforms is not None:
+            serialized = np.asarray(slot_transforms["labwareOffset"], dtype=np.float64)
+            size = serialized.shape[0]
+            transform[:size, :size] = serialized
+        transform.setflags(write=False)
+        self._labware_offset_transforms[key] = transform
+        return transform
+
 
 class LoadedModule(BaseModel):
     """A module that has been loaded."""
@@ -658,6 +712,9 @@ class LoadedLabware(BaseModel):
     )
 
 
+_HEX_COLOR_RE = re.compile(r"#(?:[0-9a-fA-F]{3,4}){1,2}$")
+
+
 class HexColor(BaseModel):
     """Hex color representation."""
 
@@ -665,7 +722,7 @@ class HexColor(BaseModel):
 
     @validator("__root__")
     def _color_is_a_valid_hex(cls, v: str) -> str:
-        match = re.search(r"^#(?:[0-9a-fA-F]{3,4}){1,2}$", v)
+        match = _HEX_COLOR_RE.match(v)
         if not match:
             raise ValueError("Color is not a valid hex color.")
         return v
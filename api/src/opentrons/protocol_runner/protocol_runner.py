@@ -46,6 +46,10 @@ from ..protocol_engine.types import (
 from ..protocols.types import PythonProtocol
 
 
+# How many items JsonRunner.load adds to the ProtocolEngine between event loop yields.
+_ADD_BATCH_SIZE = 64
+
+
 class RunResult(NamedTuple):
     """Result data from a run, pulled from the ProtocolEngine."""
 
@@ -189,10 +193,11 @@ class PythonAndLegacyRunner(AbstractRunner):
             # definitions, so we don't need to yield here.
             self._protocol_engine.add_labware_definition(definition)
 
-        # fixme(mm, 2022-12-23): This does I/O and compute-bound parsing that will block
-        # the event loop. Jira RSS-165.
-        protocol = self._protocol_file_reader.read(
-            protocol_source, labware_definitions, python_parse_mode
+        protocol = await anyio.to_thread.run_sync(
+            self._protocol_file_reader.read,
+            protocol_source,
+            labware_definitions,
+            python_parse_mode,
         )
         if isinstance(protocol, PythonProtocol):
             self._parameter_context = ParameterContext(api_version=protocol.api_level)
@@ -321,11 +326,11 @@ class JsonRunner(AbstractRunner):
             protocol,
         )
 
-        # Add commands and liquids to the ProtocolEngine.
+        # Add liquids to the ProtocolEngine.
         #
-        # We yield on every iteration so that loading large protocols doesn't block the
-        # event loop. With a 24-step 10k-command protocol (See RQA-443), adding all the
-        # commands can take 3 to 7 seconds.
+        # We yield every _ADD_BATCH_SIZE additions so that loading large protocols
+        # doesn't block the event loop, without paying for a scheduler round trip on
+        # every single item.
         #
         # It wouldn't be safe to do this in a worker thread because each addition
         # invokes the ProtocolEngine's ChangeNotifier machinery, which is not
@@ -333,14 +338,15 @@ class JsonRunner(AbstractRunner):
         liquids = await anyio.to_thread.run_sync(
             self._json_translator.translate_liquids, protocol
         )
-        for liquid in liquids:
+        for index, liquid in enumerate(liquids, start=1):
             self._protocol_engine.add_liquid(
                 id=liquid.id,
                 name=liquid.displayName,
                 description=liquid.description,
                 color=liquid.displayColor,
             )
-            await _yield()
+            if index % _ADD_BATCH_SIZE == 0:
+                await _yield()
 
         initial_home_command = pe_commands.HomeCreate(
             params=pe_commands.HomeParams(axes=None)
@@ -19,6 +19,8 @@ from opentrons.protocol_engine.types import (
 )
 from opentrons.util.get_union_elements import get_union_elements
 
+_ALLOWED_PARAMETER_TYPES = frozenset(get_union_elements(PrimitiveAllowedTypes))
+
 
 class AbstractParameterDefinition(ABC, Generic[ParamType]):
     @property
@@ -80,7 +82,7 @@ class ParameterDefinition(AbstractParameterDefinition[PrimitiveAllowedTypes]):
         self._description = validation.ensure_description(description)
         self._unit = validation.ensure_unit_string_length(unit)
 
-        if parameter_type not in get_union_elements(PrimitiveAllowedTypes):
+        if parameter_type not in _ALLOWED_PARAMETER_TYPES:
             raise ParameterDefinitionError(
                 "Parameters can only be of type int, float, str, or bool."
             )
@@ -5,6 +5,7 @@ from numpy import insert, dot
 from numpy.linalg import inv
 from numpy.typing import NDArray
 from typing import List, Tuple, Union
+from typing_extensions import Final
 
 from opentrons.calibration_storage.types import AttitudeMatrix
 
@@ -21,26 +22,47 @@ SolvePoints = Tuple[
 DoubleArray = NDArray[np.double]
 DoubleMatrix = NDArray[np.double]
 
+# Below this magnitude a calibration determinant is treated as zero
+SINGULARITY_TOLERANCE: Final[float] = 1e-9
+
 
 def identity_deck_transform() -> DoubleArray:
     """The default deck transform"""
     return np.identity(3)
 
 
+def det3(m: AttitudeMatrix) -> float:
+    """Determinant of a 3x3 matrix, without a round trip through numpy."""
+    (a, b, c), (d, e, f), (g, h, i) = m
+    return a * (e * i - f * h) - b * (d * i - f * g) + c * (d * h - e * g)
+
+
+def is_singular3(m: AttitudeMatrix) -> bool:
+    """Whether a 3x3 matrix is singular.
+
+    Anything that is not 3x3 cannot be a valid attitude, so it counts as singular.
+    """
+    if len(m) != 3 or any(len(row) != 3 for row in m):
+        return True
+    return abs(det3(m)) < SINGULARITY_TOLERANCE
+
+
+def is_singular(m: DoubleMatrix) -> bool:
+    """Whether a matrix is singular; non-square matrices count as singular."""
+    if m.ndim != 2 or m.shape[0] != m.shape[1]:
+        return True
+    return bool(abs(np.linalg.det(m)) < SINGULARITY_TOLERANCE)
+
+
 def solve_attitude(expected: SolvePoints, actual: SolvePoints) -> AttitudeMatrix:
     ex: DoubleMatrix = np.array([list(point) for point in expected]).transpose()
     ac: DoubleMatrix = np.array([list(point) for point in actual]).transpose()
     t = np.dot(ac, inv(ex))
 
-    mask_transform: NDArray[np.bool_] = np.array(
-        [[True, True, False], [True, True, False], [False, False, False]]
-    )
-    masked_array = np.ma.masked_array(t, ~mask_transform)  # type: ignore[var-annotated, no-untyped-call]
-
-    no_z_component = np.zeros((3, 3))
-    np.put(no_z_component, [8, 8], 1)
-
-    transform = masked_array.filled(0) + no_z_component  # type: ignore[no-untyped-call]
+    # Only the x/y block of the solved transform is kept; the z row and
+    # column are reset to identity.
+    transform: DoubleMatrix = np.identity(3)
+    transform[:2, :2] = t[:2, :2]
     return transform.round(4).tolist()  # type: ignore[no-any-return]
 
 
@@ -1,7 +1,17 @@
 import copy
+from dataclasses import fields
+from typing import Any, List, Union
+
+import pytest
 
 from opentrons.config import robot_configs, defaults_ot3
-from opentrons.config.types import GantryLoad, OT3Config
+from opentrons.config.types import (
+    ByGantryLoad,
+    GantryLoad,
+    OT3Config,
+    OT3CurrentSettings,
+    OT3MotionSettings,
+)
 from opentrons.hardware_control.types import OT3AxisKind
 from .ot3_settings import ot3_dummy_settings
 
@@ -197,3 +207,37 @@ def test_motion_settings_dataclass() -> None:
         OT3AxisKind.P: 20,
         OT3AxisKind.Z_G: 15,
     }
+
+
+def test_by_gantry_load_covers_all_fields() -> None:
+    built_config = robot_configs.build_config(ot3_dummy_settings)
+    assert isinstance(built_config, OT3Config)
+    all_settings: List[Union[OT3MotionSettings, OT3CurrentSettings]] = [
+        built_config.motion_settings,
+        built_config.current_settings,
+    ]
+    for settings in all_settings:
+        for gantry_load in GantryLoad:
+            assert settings.by_gantry_load(gantry_load) == {
+                field.name: getattr(settings, field.name)[gantry_load]
+                for field in fields(settings)
+            }
+            # settings are frozen, so the view is only built once
+            assert settings.by_gantry_load(gantry_load) is settings.by_gantry_load(
+                gantry_load
+            )
+    assert OT3MotionSettings._FIELD_NAMES == tuple(
+        field.name for field in fields(OT3MotionSettings)
+    )
+    assert OT3CurrentSettings._FIELD_NAMES == tuple(
+        field.name for field in fields(OT3CurrentSettings)
+    )
+
+
+def test_by_gantry_load_lookup() -> None:
+    subject = ByGantryLoad(high_throughput="high", low_throughput="low")
+    assert subject[GantryLoad.HIGH_THROUGHPUT] == "high"
+    assert subject[GantryLoad.LOW_THROUGHPUT] == "low"
+    bad_key: Any = "low_throughput"
+    with pytest.raises(KeyError):
+        subject[bad_key]
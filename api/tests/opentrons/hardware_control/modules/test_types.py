@@ -0,0 +1,86 @@
+"""Tests for hardware_control.modules.types."""
+import pytest
+
+from opentrons.hardware_control.modules.types import (
+    AbsorbanceReaderModel,
+    HeaterShakerModuleModel,
+    MagneticBlockModel,
+    MagneticModuleModel,
+    ModuleModel,
+    ModuleType,
+    TemperatureModuleModel,
+    ThermocyclerModuleModel,
+    module_model_from_string,
+)
+from opentrons.protocol_engine.types import ModuleModel as EngineModuleModel
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        *MagneticModuleModel,
+        *TemperatureModuleModel,
+        *ThermocyclerModuleModel,
+        *HeaterShakerModuleModel,
+        *MagneticBlockModel,
+        *AbsorbanceReaderModel,
+    ],
+)
+def test_module_model_from_string(model: ModuleModel) -> None:
+    """It should find the module model matching a model string."""
+    result = module_model_from_string(model.value)
+    assert result is model
+    assert type(result) is type(model)
+
+
+def test_module_model_from_engine_model() -> None:
+    """It should accept Protocol Engine module models, which are str enums."""
+    assert (
+        module_model_from_string(EngineModuleModel.THERMOCYCLER_MODULE_V2)
+        is ThermocyclerModuleModel.THERMOCYCLER_V2
+    )
+
+
+def test_module_model_from_string_raises() -> None:
+    """It should raise if the string is not a module model."""
+    with pytest.raises(ValueError, match="No such module model"):
+        module_model_from_string("fancyModuleV9")
+
+
+@pytest.mark.parametrize(
+    ("model", "expected_type"),
+    [
+        (MagneticModuleModel.MAGNETIC_V2, ModuleType.MAGNETIC),
+        (TemperatureModuleModel.TEMPERATURE_V1, ModuleType.TEMPERATURE),
+        (ThermocyclerModuleModel.THERMOCYCLER_V2, ModuleType.THERMOCYCLER),
+        (HeaterShakerModuleModel.HEATER_SHAKER_V1, ModuleType.HEATER_SHAKER),
+        (MagneticBlockModel.MAGNETIC_BLOCK_V1, ModuleType.MAGNETIC_BLOCK),
+        (AbsorbanceReaderModel.ABSORBANCE_READER_V1, ModuleType.ABSORBANCE_READER),
+    ],
+)
+def test_module_type_from_model(model: ModuleModel, expected_type: ModuleType) -> None:
+    """It should map each module model to its module type."""
+    assert ModuleType.from_model(model) is expected_type
+
+
+@pytest.mark.parametrize(
+    ("module_type", "expected_fixture_id"),
+    [
+        (ModuleType.THERMOCYCLER, "thermocyclerModuleV2Front"),
+        (ModuleType.TEMPERATURE, "temperatureModuleV2"),
+        (ModuleType.HEATER_SHAKER, "heaterShakerModuleV1"),
+        (ModuleType.MAGNETIC_BLOCK, "magneticBlockV1"),
+        (ModuleType.ABSORBANCE_READER, "absorbanceReaderV1"),
+    ],
+)
+def test_to_module_fixture_id(
+    module_type: ModuleType, expected_fixture_id: str
+) -> None:
+    """It should map each module type to its cutout fixture ID."""
+    assert ModuleType.to_module_fixture_id(module_type) == expected_fixture_id
+
+
+def test_to_module_fixture_id_raises() -> None:
+    """It should raise for module types without a cutout fixture."""
+    with pytest.raises(ValueError, match="does not have a related fixture ID"):
+        ModuleType.to_module_fixture_id(ModuleType.MAGNETIC)
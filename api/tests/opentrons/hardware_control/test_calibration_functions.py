@@ -1,10 +1,12 @@
 from pathlib import Path
 
 import numpy as np
+import pytest
 
 from opentrons import config, calibration_storage
 
 from opentrons.hardware_control import robot_calibration
+from opentrons.hardware_control.util import DeckTransformState
 from opentrons.hardware_control.instruments.ot2 import instrument_calibration
 from opentrons.util.helpers import utc_now
 from opentrons.types import Mount, Point
@@ -24,6 +26,54 @@ def test_migrate_affine_xy_to_attitude():
     assert result == expected
 
 
+@pytest.mark.parametrize(
+    "gantry_cal,expected",
+    [
+        (
+            [[1, 0, 0, 1], [0, 1, 0, 2], [0, 0, 1, -25], [0, 0, 0, 1]],
+            DeckTransformState.OK,
+        ),
+        (
+            [[1, 0, 0, 1], [0, 1, 0, 2], [0, 0, 1, -5], [0, 0, 0, 1]],
+            DeckTransformState.BAD_CALIBRATION,
+        ),
+        (
+            [[1, 0, 0, 1], [1, 0, 0, 2], [0, 0, 1, -25], [0, 0, 0, 1]],
+            DeckTransformState.SINGULARITY,
+        ),
+        (
+            [[1, 0, 0, 1], [0, 1, 0, 2], [0, 0, 1, -25]],
+            DeckTransformState.SINGULARITY,
+        ),
+        ([[1, 0, 0], [0, 1, 0], [0, 0, 1]], DeckTransformState.IDENTITY),
+        (
+            [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]],
+            DeckTransformState.IDENTITY,
+        ),
+    ],
+)
+def test_validate_gantry_calibration(gantry_cal, expected):
+    assert robot_calibration.validate_gantry_calibration(gantry_cal) == expected
+
+
+@pytest.mark.parametrize(
+    "attitude,expected",
+    [
+        ([[1, 0, 0], [0, 1, 0], [0, 0, 1]], DeckTransformState.OK),
+        ([[1, 0, 0], [1, 0, 0], [0, 0, 1]], DeckTransformState.SINGULARITY),
+        ([[1, 0, 0], [0, 1, 0]], DeckTransformState.SINGULARITY),
+    ],
+)
+def test_validate_attitude_deck_calibration(attitude, expected):
+    deck_cal = robot_calibration.DeckCalibration(
+        attitude=attitude,
+        source=calibration_storage.types.SourceType.user,
+        status=calibration_storage.types.CalibrationStatus(),
+        last_modified=utc_now(),
+    )
+    assert robot_calibration.validate_attitude_deck_calibration(deck_cal) == expected
+
+
 def test_save_calibration(ot_config_tempdir):
     pathway = (
         config.get_opentrons_path("robot_calibration_dir") / "deck_calibration.json"
@@ -55,11 +105,15 @@ def test_load_calibration(ot_config_tempdir):
         "pipette_calibrated_with": "fake",
         "last_modified": utc_now(),
         "tiprack": "hash",
+        "status": {"markedBad": True, "source": "user", "markedAt": None},
     }
     calibration_storage.file_operators.save_to_file(pathway, "deck_calibration", data)
     obj = robot_calibration.load_attitude_matrix()
     transform = [[1, 0, 1], [0, 1, -0.5], [0, 0, 1]]
     assert np.allclose(obj.attitude, transform)
+    assert obj.status == calibration_storage.types.CalibrationStatus(
+        markedBad=True, source=calibration_storage.types.SourceType.user
+    )
 
 
 def test_load_malformed_calibration(ot_config_tempdir):
@@ -1,9 +1,11 @@
 import asyncio
+import gc
 import pytest
 from opentrons.hardware_control import (
     ExecutionManager,
     ExecutionState,
 )
+from opentrons.hardware_control.execution_manager import ExecutionManagerProvider
 from opentrons_shared_data.errors.exceptions import ExecutionCancelledError
 
 
@@ -13,23 +15,23 @@ async def test_state_machine():
     and PAUSE when it when pause is called, unless CANCELLED
     """
     exec_mgr = ExecutionManager()
-    assert await exec_mgr.get_state() == ExecutionState.RUNNING
+    assert exec_mgr.get_state() == ExecutionState.RUNNING
 
     # passes through on wait_for_is_running if state is RUNNING
     await asyncio.wait_for(exec_mgr.wait_for_is_running(), timeout=0.2)
 
     await exec_mgr.pause()
-    assert await exec_mgr.get_state() == ExecutionState.PAUSED
+    assert exec_mgr.get_state() == ExecutionState.PAUSED
 
     with pytest.raises(asyncio.TimeoutError):
         # should stall on wait_for_is_running when state is PAUSED
         await asyncio.wait_for(exec_mgr.wait_for_is_running(), timeout=0.2)
 
     await exec_mgr.resume()
-    assert await exec_mgr.get_state() == ExecutionState.RUNNING
+    assert exec_mgr.get_state() == ExecutionState.RUNNING
 
     await exec_mgr.cancel()
-    assert await exec_mgr.get_state() == ExecutionState.CANCELLED
+    assert exec_mgr.get_state() == ExecutionState.CANCELLED
 
     with pytest.raises(ExecutionCancelledError):
         # attempting to pause when CANCELLED should raise
@@ -40,7 +42,7 @@ async def test_state_machine():
         await asyncio.wait_for(exec_mgr.wait_for_is_running(), timeout=0.2)
 
     await exec_mgr.reset()
-    assert await exec_mgr.get_state() == ExecutionState.RUNNING
+    assert exec_mgr.get_state() == ExecutionState.RUNNING
 
 
 async def test_cancel_tasks():
@@ -75,3 +77,50 @@ async def test_cancel_tasks():
     assert cancellable_task not in all_tasks
 
     other_task.cancel()
+
+
+async def test_finished_tasks_are_not_retained():
+    """
+    Test that an execution manager does not keep finished
+    cancellable tasks alive
+    """
+    exec_mgr = ExecutionManager()
+
+    async def quick_task():
+        pass
+
+    task = asyncio.get_running_loop().create_task(quick_task())
+    exec_mgr.register_cancellable_task(task)
+    await task
+    del task
+    # let the loop drop its own references to the finished task
+    await asyncio.sleep(0)
+    gc.collect()
+
+    assert len(exec_mgr._cancellable_tasks) == 0
+
+
+async def test_wait_for_running_decorator():
+    """
+    Test that decorated methods run straight through while running
+    and block while paused
+    """
+
+    class Provider(ExecutionManagerProvider):
+        @ExecutionManagerProvider.wait_for_running
+        async def move(self) -> str:
+            return "moved"
+
+    provider = Provider(simulator=False)
+    assert await provider.move() == "moved"
+
+    await provider.execution_manager.pause()
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(provider.move(), timeout=0.2)
+
+    await provider.execution_manager.resume()
+    assert await asyncio.wait_for(provider.move(), timeout=0.2) == "moved"
+
+    await provider.execution_manager.cancel()
+    with pytest.raises(ExecutionCancelledError):
+        await provider.move()
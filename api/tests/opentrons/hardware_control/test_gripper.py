@@ -138,3 +138,21 @@ def test_jaw_calibration() -> None:
         / 2
     )
     assert subject.max_jaw_width == fake_gripper_conf.geometry.jaw_width["max"] + 2
+
+
+@pytest.mark.ot3_only
+def test_duty_cycle_by_force(fake_offset: "GripperCalibrationOffset") -> None:
+    gripr = gripper.Gripper(fake_gripper_conf, fake_offset, "fakeid123")
+    profile = fake_gripper_conf.grip_force_profile
+    for force in (
+        profile.default_grip_force,
+        profile.default_idle_force,
+        profile.default_home_force,
+        profile.min,
+        profile.max,
+    ):
+        assert gripr.duty_cycle_by_force(force) == pytest.approx(
+            gripper_config.duty_cycle_by_force(force, profile)
+        )
+    with pytest.raises(ValueError):
+        gripr.duty_cycle_by_force(profile.max + 1)
@@ -1,5 +1,6 @@
 """Tests for OT3 calibration."""
 import copy
+import datetime
 from dataclasses import replace
 import pytest
 import json
@@ -10,6 +11,9 @@ from opentrons.hardware_control import ThreadManager
 from opentrons.hardware_control.ot3api import OT3API
 from opentrons.hardware_control.types import OT3Mount, Axis, InstrumentProbeType
 from opentrons.config.types import OT3CalibrationSettings
+from opentrons.config.robot_configs import default_ot3_deck_calibration
+from opentrons.calibration_storage import types as cal_types
+from opentrons.calibration_storage.ot3.deck_attitude import save_robot_belt_attitude
 from opentrons.hardware_control.ot3_calibration import (
     find_edge_binary,
     find_axis_center,
@@ -21,6 +25,8 @@ from opentrons.hardware_control.ot3_calibration import (
     _edges_from_data,
     _probe_deck_at,
     _verify_edge_pos,
+    apply_machine_transform,
+    load_attitude_matrix,
     PREP_OFFSET_DEPTH,
     EDGES,
 )
@@ -408,3 +414,37 @@ async def test_noncontact_sanity(
             center + EDGES["right"],
             Axis.X,
         )
+
+
+def test_load_default_attitude_matrix() -> None:
+    with patch(
+        "opentrons.hardware_control.ot3_calibration.get_robot_belt_attitude"
+    ) as get_belt_attitude:
+        first = load_attitude_matrix(to_default=True)
+        second = load_attitude_matrix(to_default=True)
+    get_belt_attitude.assert_not_called()
+    expected = apply_machine_transform(default_ot3_deck_calibration())
+    assert first.attitude == second.attitude == expected
+    # each calibration gets its own matrix to mutate
+    assert first.attitude is not second.attitude
+    assert first.attitude[0] is not second.attitude[0]
+
+
+def test_load_stored_attitude_matrix_status(ot_config_tempdir: object) -> None:
+    marked_at = datetime.datetime(2024, 1, 2, tzinfo=datetime.timezone.utc)
+    save_robot_belt_attitude(
+        [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]],
+        "pip-id",
+        cal_status=cal_types.CalibrationStatus(
+            markedBad=True,
+            source=cal_types.SourceType.user,
+            markedAt=marked_at,
+        ),
+    )
+    deck_calibration = load_attitude_matrix(to_default=False)
+    assert deck_calibration.status == cal_types.CalibrationStatus(
+        markedBad=True,
+        source=cal_types.SourceType.user,
+        markedAt=marked_at,
+    )
+    assert deck_calibration.pipette_calibrated_with == "pip-id"
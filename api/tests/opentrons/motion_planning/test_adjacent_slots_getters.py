@@ -207,3 +207,14 @@ def test_get_surrounding_slots(
         get_surrounding_slots(slot=slot, robot_type=robot_type)
         == expected_surrounding_slots
     )
+
+
+def test_get_surrounding_slots_returns_new_lists() -> None:
+    """Callers should be free to modify the returned lists."""
+    first = get_surrounding_slots(slot=6, robot_type="OT-3 Standard")
+    first.regular_slots.clear()
+    first.staging_slots.clear()
+
+    second = get_surrounding_slots(slot=6, robot_type="OT-3 Standard")
+    assert second.regular_slots != []
+    assert second.staging_slots != []
@@ -26,7 +26,6 @@ from opentrons.protocol_engine import (
     StateView,
 )
 from opentrons.protocol_engine.clients import SyncClient
-from opentrons.protocol_engine.errors import LabwareNotLoadedOnModuleError
 from opentrons.types import DeckSlotName, Point, StagingSlotName
 
 from opentrons.protocol_engine.types import (
@@ -154,6 +153,55 @@ def test_maps_labware_on_deck(decoy: Decoy, mock_state_view: StateView) -> None:
     )
 
 
+@pytest.mark.parametrize(
+    ("robot_type", "deck_type"),
+    [
+        ("OT-2 Standard", DeckType.OT2_STANDARD),
+        ("OT-3 Standard", DeckType.OT3_STANDARD),
+    ],
+)
+def test_checks_new_labware_on_empty_deck(
+    decoy: Decoy, mock_state_view: StateView
+) -> None:
+    """It should still check a new labware when nothing else is on the deck."""
+    decoy.when(
+        mock_state_view.labware.get_location(labware_id="labware-id")
+    ).then_return(DeckSlotLocation(slotName=DeckSlotName.SLOT_5))
+    decoy.when(
+        mock_state_view.labware.get_load_name(labware_id="labware-id")
+    ).then_return("labware_load_name")
+    decoy.when(
+        mock_state_view.geometry.get_labware_highest_z(labware_id="labware-id")
+    ).then_return(3.14159)
+    decoy.when(
+        mock_state_view.labware.get_definition_uri(labware_id="labware-id")
+    ).then_return(LabwareUri("test/labware_load_name/123"))
+    decoy.when(
+        mock_state_view.labware.is_fixed_trash(labware_id="labware-id")
+    ).then_return(False)
+
+    deck_conflict.check(
+        engine_state=mock_state_view,
+        existing_labware_ids=[],
+        existing_module_ids=[],
+        existing_disposal_locations=[],
+        new_labware_id="labware-id",
+    )
+    decoy.verify(
+        wrapped_deck_conflict.check(
+            existing_items={},
+            new_item=wrapped_deck_conflict.Labware(
+                name_for_errors="labware_load_name",
+                highest_z=3.14159,
+                uri=LabwareUri("test/labware_load_name/123"),
+                is_fixed_trash=False,
+            ),
+            new_location=DeckSlotName.SLOT_5,
+            robot_type=mock_state_view.config.robot_type,
+        )
+    )
+
+
 @pytest.mark.parametrize(
     ("robot_type", "deck_type"),
     [
@@ -163,9 +211,7 @@ def test_maps_labware_on_deck(decoy: Decoy, mock_state_view: StateView) -> None:
 )
 def test_maps_module_without_labware(decoy: Decoy, mock_state_view: StateView) -> None:
     """It should correctly map a module with no labware loaded atop it."""
-    decoy.when(mock_state_view.labware.get_id_by_module("module-id")).then_raise(
-        LabwareNotLoadedOnModuleError()
-    )
+    decoy.when(mock_state_view.labware.find_id_by_module("module-id")).then_return(None)
     decoy.when(mock_state_view.modules.get_overall_height("module-id")).then_return(
         3.14159
     )
@@ -217,7 +263,7 @@ def test_maps_module_with_labware(decoy: Decoy, mock_state_view: StateView) -> N
 
     The highest_z should include both the labware and the module.
     """
-    decoy.when(mock_state_view.labware.get_id_by_module("module-id")).then_return(
+    decoy.when(mock_state_view.labware.find_id_by_module("module-id")).then_return(
         "labware-id"
     )
     decoy.when(
@@ -306,9 +352,7 @@ def test_maps_different_module_models(
         module_model
     )
 
-    decoy.when(mock_state_view.labware.get_id_by_module("module-id")).then_raise(
-        LabwareNotLoadedOnModuleError()
-    )
+    decoy.when(mock_state_view.labware.find_id_by_module("module-id")).then_return(None)
     decoy.when(mock_state_view.modules.get_overall_height("module-id")).then_return(
         3.14159
     )
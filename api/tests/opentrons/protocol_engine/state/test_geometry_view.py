@@ -865,9 +865,7 @@ def test_get_highest_z_in_slot_with_single_module(
     decoy.when(mock_module_view.get_by_slot(DeckSlotName.SLOT_3)).then_return(
         module_in_slot
     )
-    decoy.when(mock_labware_view.get_id_by_module("only-module")).then_raise(
-        errors.LabwareNotLoadedOnModuleError("only module")
-    )
+    decoy.when(mock_labware_view.find_id_by_module("only-module")).then_return(None)
     decoy.when(mock_labware_view.get_deck_definition()).then_return(
         ot2_standard_deck_def
     )
@@ -1021,7 +1019,7 @@ def test_get_highest_z_in_slot_with_labware_stack_on_module(
         module_on_slot
     )
 
-    decoy.when(mock_labware_view.get_id_by_module("module-id")).then_return(
+    decoy.when(mock_labware_view.find_id_by_module("module-id")).then_return(
         "adapter-id"
     )
     decoy.when(mock_labware_view.get_id_by_labware("adapter-id")).then_return(
@@ -169,6 +169,22 @@ def test_get_id_by_module_raises_error() -> None:
         subject.get_id_by_module(module_id="no-module-id")
 
 
+def test_find_id_by_module() -> None:
+    """Should return the labware id on the module, or None if there isn't one."""
+    subject = get_labware_view(
+        labware_by_id={
+            "labware-id": LoadedLabware(
+                id="labware-id",
+                loadName="test",
+                definitionUri="test-uri",
+                location=ModuleLocation(moduleId="module-id"),
+            )
+        }
+    )
+    assert subject.find_id_by_module(module_id="module-id") == "labware-id"
+    assert subject.find_id_by_module(module_id="no-module-id") is None
+
+
 def test_get_id_by_labware() -> None:
     """Should return the labware id associated to the labware."""
     subject = get_labware_view(
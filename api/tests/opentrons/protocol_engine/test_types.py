@@ -1,8 +1,17 @@
 """Test protocol engine types."""
+from typing import Callable, List
+
+import numpy as np
 import pytest
 from pydantic import ValidationError
 
-from opentrons.protocol_engine.types import HexColor
+from opentrons.hardware_control.modules.types import ModuleType
+from opentrons.protocol_engine.types import (
+    HexColor,
+    LabwareOffsetVector,
+    ModuleDefinition,
+    ModuleModel,
+)
 
 
 @pytest.mark.parametrize("hex_color", ["#F00", "#FFCC00CC", "#FC0C", "#98e2d1"])
@@ -16,3 +25,124 @@ def test_handles_invalid_hex() -> None:
     """Should raise a validation error."""
     with pytest.raises(ValidationError):
         HexColor(__root__="#123456789")
+
+
+@pytest.mark.parametrize(
+    ("model", "expected_type"),
+    [
+        (ModuleModel.TEMPERATURE_MODULE_V1, ModuleType.TEMPERATURE),
+        (ModuleModel.TEMPERATURE_MODULE_V2, ModuleType.TEMPERATURE),
+        (ModuleModel.MAGNETIC_MODULE_V1, ModuleType.MAGNETIC),
+        (ModuleModel.MAGNETIC_MODULE_V2, ModuleType.MAGNETIC),
+        (ModuleModel.THERMOCYCLER_MODULE_V1, ModuleType.THERMOCYCLER),
+        (ModuleModel.THERMOCYCLER_MODULE_V2, ModuleType.THERMOCYCLER),
+        (ModuleModel.HEATER_SHAKER_MODULE_V1, ModuleType.HEATER_SHAKER),
+        (ModuleModel.MAGNETIC_BLOCK_V1, ModuleType.MAGNETIC_BLOCK),
+        (ModuleModel.ABSORBANCE_READER_V1, ModuleType.ABSORBANCE_READER),
+    ],
+)
+def test_module_model_as_type(model: ModuleModel, expected_type: ModuleType) -> None:
+    """Should get the module type of every module model."""
+    assert model.as_type() is expected_type
+
+
+def test_module_model_classifiers() -> None:
+    """Should classify each module model as exactly one kind of module."""
+    classifiers: List[Callable[[ModuleModel], bool]] = [
+        ModuleModel.is_temperature_module_model,
+        ModuleModel.is_magnetic_module_model,
+        ModuleModel.is_thermocycler_module_model,
+        ModuleModel.is_heater_shaker_module_model,
+        ModuleModel.is_magnetic_block,
+        ModuleModel.is_absorbance_reader,
+    ]
+    for model in ModuleModel:
+        assert [classify(model) for classify in classifiers].count(True) == 1
+    assert ModuleModel.is_temperature_module_model(ModuleModel.TEMPERATURE_MODULE_V2)
+    assert not ModuleModel.is_magnetic_module_model(ModuleModel.MAGNETIC_BLOCK_V1)
+
+
+def test_labware_offset_vector_arithmetic() -> None:
+    """Should add and subtract offset vectors into equivalent validated vectors."""
+    a = LabwareOffsetVector(x=1, y=2.5, z=-3)
+    b = LabwareOffsetVector(x=0.5, y=0.5, z=1)
+
+    assert a + b == LabwareOffsetVector(x=1.5, y=3.0, z=-2.0)
+    assert a - b == LabwareOffsetVector(x=0.5, y=2.0, z=-4.0)
+    assert (a + b).dict() == {"x": 1.5, "y": 3.0, "z": -2.0}
+    assert isinstance((a - b).x, float)
+
+
+def test_module_definition_labware_offset_transform(
+    tempdeck_v2_def: ModuleDefinition,
+) -> None:
+    """It should parse and cache a slot's labware offset transform."""
+    result = tempdeck_v2_def.get_labware_offset_transform("ot2_standard", "3")
+
+    assert result.tolist() == [
+        [-1, 0, 0, -0.3],
+        [0, 1, 0, 0],
+        [0, 0, 1, 0],
+        [0, 0, 0, 1],
+    ]
+    assert tempdeck_v2_def.get_labware_offset_transform("ot2_standard", "3") is result
+    assert not result.flags.writeable
+
+
+def test_module_definition_labware_offset_transform_defaults(
+    tempdeck_v2_def: ModuleDefinition,
+) -> None:
+    """It should pad legacy 3x3 transforms and default missing ones to identity."""
+    definition_dict = tempdeck_v2_def.dict()
+    definition_dict["slotTransforms"] = {
+        "ot2_standard": {"3": {"labwareOffset": [[-1, 0, 0], [0, 1, 0], [0, 0, 1]]}}
+    }
+    subject = ModuleDefinition.parse_obj(definition_dict)
+
+    assert subject.get_labware_offset_transform("ot2_standard", "3").tolist() == [
+        [-1, 0, 0, 0],
+        [0, 1, 0, 0],
+        [0, 0, 1, 0],
+        [0, 0, 0, 1],
+    ]
+    assert np.array_equal(
+        subject.get_labware_offset_transform("ot2_standard", "1"), np.identity(4)
+    )
+    assert np.array_equal(
+        subject.get_labware_offset_transform("ot2_short_trash", "3"), np.identity(4)
+    )
+
+
+def test_module_definition_labware_offset_transform_after_copy(
+    tempdeck_v2_def: ModuleDefinition,
+) -> None:
+    """It should not reuse cached transforms when a copy replaces slotTransforms."""
+    original = tempdeck_v2_def.copy()
+    original_transform = original.get_labware_offset_transform("ot2_standard", "3")
+
+    subject = original.copy(
+        update={
+            "slotTransforms": {
+                "ot2_standard": {
+                    "3": {
+                        "labwareOffset": [
+                            [1, 0, 0, 5],
+                            [0, 1, 0, 0],
+                            [0, 0, 1, 0],
+                            [0, 0, 0, 1],
+                        ]
+                    }
+                }
+            }
+        }
+    )
+
+    assert subject.get_labware_offset_transform("ot2_standard", "3").tolist() == [
+        [1, 0, 0, 5],
+        [0, 1, 0, 0],
+        [0, 0, 1, 0],
+        [0, 0, 0, 1],
+    ]
+    assert original.get_labware_offset_transform("ot2_standard", "3") is (
+        original_transform
+    )
@@ -1,5 +1,13 @@
 from math import pi, sin, cos
-from opentrons.util.linal import solve, add_z, apply_transform, solve_attitude
+from opentrons.util.linal import (
+    solve,
+    add_z,
+    apply_transform,
+    solve_attitude,
+    det3,
+    is_singular,
+    is_singular3,
+)
 from numpy.linalg import inv
 import numpy as np
 from numpy.typing import NDArray
@@ -66,3 +74,40 @@ def test_apply_transform() -> None:
 
     result = apply_transform(inv(transform), (1, 2, 3))
     assert np.isclose(result, expected, atol=0.1).all()
+
+
+def test_det3() -> None:
+    matrices = [
+        [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]],
+        [[0.99, 0.01, 0.0], [-0.02, 1.01, 0.0], [0.0, 0.0, 1.0]],
+        [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 9.0]],
+        [[2.0, -1.0, 0.5], [0.0, 3.0, 1.0], [4.0, 0.0, -2.0]],
+    ]
+    for m in matrices:
+        assert np.isclose(det3(m), np.linalg.det(np.array(m)))
+
+
+def test_is_singular3() -> None:
+    assert not is_singular3([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+    assert is_singular3([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 9.0]])
+    # anything that is not 3x3 is not a usable attitude
+    assert is_singular3([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+    assert is_singular3([[1.0, 0.0], [0.0, 1.0], [0.0, 0.0]])
+
+
+def test_is_singular() -> None:
+    assert not is_singular(np.identity(4))
+    assert is_singular(np.array([[1.0, 0.0], [1.0, 0.0]]))
+    assert is_singular(np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]))
+
+
+def test_solve_attitude_drops_z() -> None:
+    e = ((1, 1, 3), (2, 2, 2), (1, 2, 1))
+    a = ((1.1, 1.2, 3.3), (2.1, 2.2, 2.2), (1.1, 2.2, 1.1))
+    transform = solve_attitude(e, a)
+
+    full: NDArray[np.double] = np.dot(np.array(a).transpose(), inv(np.array(e).T))
+    assert transform[0][:2] == full[0][:2].round(4).tolist()
+    assert transform[1][:2] == full[1][:2].round(4).tolist()
+    assert [transform[0][2], transform[1][2]] == [0.0, 0.0]
+    assert transform[2] == [0.0, 0.0, 1.0]
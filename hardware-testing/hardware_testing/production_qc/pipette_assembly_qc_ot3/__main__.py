@@ -4,7 +4,7 @@
 
 import argparse
 import asyncio
-from dataclasses import dataclass, fields
+from dataclasses import dataclass, fields, replace
 import os
 from pathlib import Path
 from time import time
@@ -1861,5 +1861,7 @@ if __name__ == "__main__":
     # NOTE: overwrite default aspirate sample-count from user's input
     # FIXME: this value is being set in a few places, maybe there's a way to clean this up
     for tag in [PressureEvent.ASPIRATE_P50, PressureEvent.ASPIRATE_P1000]:
-        PRESSURE_CFG[tag].sample_count = _cfg.fixture_aspirate_sample_count
+        PRESSURE_CFG[tag] = replace(
+            PRESSURE_CFG[tag], sample_count=_cfg.fixture_aspirate_sample_count
+        )
     asyncio.run(_main(_cfg))
@@ -2,14 +2,15 @@
 from dataclasses import dataclass
 import enum
 from typing import Dict
+from typing_extensions import Final
 
 from hardware_testing.opentrons_api.types import Point
 
 
-LOCATION_A1_LEFT = Point(x=14.4, y=74.5, z=100)
-LOCATION_A1_RIGHT = LOCATION_A1_LEFT._replace(x=128 - LOCATION_A1_LEFT.x)
+LOCATION_A1_LEFT: Final = Point(x=14.4, y=74.5, z=100)
+LOCATION_A1_RIGHT: Final = LOCATION_A1_LEFT._replace(x=128 - LOCATION_A1_LEFT.x)
 
-PRESSURE_FIXTURE_TIP_VOLUME = 50  # always 50ul
+PRESSURE_FIXTURE_TIP_VOLUME: Final = 50  # always 50ul
 
 
 class PressureEvent(enum.Enum):
@@ -23,7 +24,7 @@ class PressureEvent(enum.Enum):
     POST = "post"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PressureEventConfig:
     """PressureEventConfig."""
 
@@ -49,14 +50,14 @@ PRESSURE_ASPIRATE_DELTA_SPEC = {
     },
 }
 
-DEFAULT_PRESSURE_SAMPLE_DELAY = 0.25
-DEFAULT_PRESSURE_SAMPLE_COUNT = 10
+DEFAULT_PRESSURE_SAMPLE_DELAY: Final = 0.25
+DEFAULT_PRESSURE_SAMPLE_COUNT: Final = 10
 # FIXME: reduce once firmware latency is reduced
-DEFAULT_STABILIZE_SECONDS = 1
+DEFAULT_STABILIZE_SECONDS: Final = 1
 # NOTE: number of samples during aspirate ideally creates ~2 minutes of data
 # but we want to keep the number of samples constant between test runs,
 # so that is why we don't specify a sample duration (b/c frequency is unpredictable)
-DEFAULT_PRESSURE_SAMPLE_COUNT_DURING_ASPIRATE = int(
+DEFAULT_PRESSURE_SAMPLE_COUNT_DURING_ASPIRATE: Final = int(
     (1 * 60) / DEFAULT_PRESSURE_SAMPLE_DELAY
 )
 PRESSURE_NONE = PressureEventConfig(